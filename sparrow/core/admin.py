@@ -10,7 +10,7 @@ admin.site.register(RatingFlagType)
 admin.site.register(RatingFlag)
 admin.site.register(Route)
 admin.site.register(Group)
-admin.site.register(isWithin)
+admin.site.register(IsWithin)
 admin.site.register(BelongsTo)
 admin.site.register(Attraction)
 admin.site.register(IsTagged)
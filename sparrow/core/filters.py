@@ -0,0 +1,47 @@
+import django_filters
+from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Exists, OuterRef
+from .models import Route, IsWithin, IsTagged
+
+
+# the filters on the attractions within a route use EXISTS subqueries instead of joins,
+# which would return a route once for every matching attraction (or tag of an attraction);
+# the filter names match the previous lookups, so the query parameters remain unchanged
+class RouteFilterSet(django_filters.FilterSet):
+    isWithin__attraction__name = django_filters.CharFilter(method='filterByAttractionName')
+    isWithin__attraction__isTagged__tag__tagName = django_filters.CharFilter(method='filterByTagName')
+
+    class Meta:
+        model = Route
+        # reverse relations filtered by id can match at most one related row, so plain joins suffice
+        fields = ['verified', 'user__baseUser__username', 'user__baseUser__first_name', 'user__baseUser__last_name',
+                  'group__name', 'notebook__id', 'user', 'group', 'ratingFlag__id']
+
+    def filterByAttractionName(self, queryset, name, value):
+        attractionsWithinRoute = IsWithin.objects.filter(route=OuterRef('pk'), attraction__name=value)
+        return queryset.filter(Exists(attractionsWithinRoute))
+
+    def filterByTagName(self, queryset, name, value):
+        tagsWithinRoute = IsTagged.objects.filter(attraction__isWithin__route=OuterRef('pk'), tag__tagName=value)
+        return queryset.filter(Exists(tagsWithinRoute))
+
+
+# django-filter generates a FilterSet class out of a view's filterset_fields on every request;
+# the generated classes are kept instead, one for every view and model, so that the
+# (metaclass-driven) filter construction only runs on the first request
+class CachedFilterBackend(DjangoFilterBackend):
+    filtersetClasses = {}
+
+    def get_filterset_class(self, view, queryset=None):
+        # explicitly declared filtersets are returned as they are
+        if getattr(view, 'filterset_class', None) or queryset is None:
+            return super().get_filterset_class(view, queryset)
+
+        key = (type(view), queryset.model)
+        filtersetClass = self.filtersetClasses.get(key)
+
+        if filtersetClass is None:
+            filtersetClass = super().get_filterset_class(view, queryset)
+            self.filtersetClasses[key] = filtersetClass
+
+        return filtersetClass
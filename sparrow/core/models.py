@@ -1,12 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
 
 defaultProfilePhoto = 'default-profile-photo.jpeg'
 
 
 # many-to-many between Route & Attraction
-class isWithin (models.Model):
+class IsWithin(models.Model):
     route = models.ForeignKey('Route', on_delete=models.CASCADE, db_column='route_id')
     attraction = models.ForeignKey('Attraction', on_delete=models.CASCADE, db_column='attraction_id')
     # the orderNumber of the attraction in the current route
@@ -36,6 +37,9 @@ class Route(models.Model):
         db_table = 'route'
         ordering = ['-publicationDate']
         default_related_name = 'route'
+        # the list endpoint filters on 'verified' and sorts by the default ordering;
+        # the user and group columns are already indexed, being foreign keys
+        indexes = [models.Index(fields=['verified', '-publicationDate'], name='route_verified_date_idx')]
 
     def clean(self):
         if (self.group is None and self.user is None) or (self.group is not None and self.user is not None):
@@ -50,6 +54,8 @@ class Attraction(models.Model):
     generalDescription = models.CharField(max_length=3000, db_column='general_description')
     latitude = models.FloatField(db_column='latitude')
     longitude = models.FloatField(db_column='longitude')
+    # changes with every modification, invalidating the cached representations of the attraction
+    updatedAt = models.DateTimeField(auto_now=True, db_column='updated_at')
 
     class Meta:
         db_table = 'attraction'
@@ -211,3 +217,12 @@ class Image(models.Model):
 
     def __str__(self):
         return self.imagePath
+
+    # removes the image file from the media directory, before deleting the instance itself
+    def delete(self, *args, **kwargs):
+        try:
+            default_storage.delete(self.imagePath)
+        except Exception:
+            raise ValidationError('Failed to delete image {}'.format(self.imagePath))
+
+        return super().delete(*args, **kwargs)
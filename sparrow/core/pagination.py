@@ -0,0 +1,8 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+# the page size defaults to the PAGE_SIZE setting; clients can request
+# a different one, up to a bound which keeps list responses small
+class DefaultPagination(PageNumberPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = 100
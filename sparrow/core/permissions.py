@@ -1,4 +1,5 @@
 from rest_framework import permissions
+from django.db.models import Q
 from .serializers import BelongsToSerializer, RatingFlagSerializer, IsWithinSerializer
 from .models import *
 
@@ -137,6 +138,19 @@ class RouteIsPublic(permissions.BasePermission):
 
         return publicCondition or userCondition or groupCondition
 
+    # the same conditions, expressed as a database filter, so that the routes of a list action don't
+    # have to be checked one by one; 'prefix' is the lookup path from the filtered model to the route
+    def getQueryFilter(self, request, prefix=''):
+        # the user and group conditions can't hold for anonymous users either
+        if not request.user or not request.user.is_authenticated:
+            return Q(pk__in=[])
+
+        groupsOfTheUser = BelongsTo.objects.filter(user_id=request.user.id).values('group_id')
+
+        return (Q(**{prefix + 'public': True})
+                | Q(**{prefix + 'user_id': request.user.id})
+                | Q(**{prefix + 'group_id__in': groupsOfTheUser}))
+
 
 class RatingFlagAuthorization(permissions.BasePermission):
     # necessary for the 'create' action
@@ -2,34 +2,170 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import check_password
-from django.contrib.auth.password_validation import validate_password
 from django.core.files.storage import default_storage
 from django.conf import settings
-from .models import *
-from datetime import date
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from .models import (Member, Group, BelongsTo, Route, IsWithin, Attraction, Status,
+                     Tag, IsTagged, Notebook, RatingFlag, RatingFlagType, Image)
+from collections import OrderedDict
+from copy import copy
+from functools import lru_cache
+from threading import Lock
+import hashlib
+import os
 import uuid
 
 
+# the configured password validators are instantiated once, instead of on every password change;
+# this happens on first use, rather than at import time, since some of them load sizeable
+# resources (e.g. the common passwords list) that most workers never need
+@lru_cache(maxsize=1)
+def getPasswordValidators():
+    from django.contrib.auth.password_validation import get_password_validators
+    return get_password_validators(settings.AUTH_PASSWORD_VALIDATORS)
+
+
+# bounded LRU cache for the results of password hash verifications, which are slow by design;
+# entries are keyed by a keyed hash of the provided plaintext (the key is random and never
+# leaves the process, so the plaintext is never stored) and the stored password hash
+passwordCheckCacheSize = 1024
+passwordCheckCache = OrderedDict()
+passwordCheckCacheLock = Lock()
+passwordCheckKey = os.urandom(32)
+
+
+def cachedCheckPassword(password, encoded):
+    key = (hashlib.blake2b(password.encode(), key=passwordCheckKey, digest_size=16).digest(), encoded)
+
+    with passwordCheckCacheLock:
+        result = passwordCheckCache.get(key)
+        if result is not None:
+            passwordCheckCache.move_to_end(key)
+            return result
+
+    result = check_password(password, encoded)
+
+    with passwordCheckCacheLock:
+        passwordCheckCache[key] = result
+        if len(passwordCheckCache) > passwordCheckCacheSize:
+            passwordCheckCache.popitem(last=False)
+
+    return result
+
+
+# outcomes of recent authentication attempts, so that repeated attempts with the same
+# credentials (e.g. credential stuffing) don't run the password hasher every time;
+# the credentials are only used through a hash keyed per process, successful attempts store
+# the user's id along with their session hash, which changes with the password, and rejected
+# attempts store the state of the user (see getUserState), which changes upon registration,
+# password changes and reactivation
+authenticationCacheTimeout = 60
+
+
+def getAuthenticationCacheKey(username, password):
+    digest = hashlib.blake2b(f'{username}:{password}'.encode(), key=passwordCheckKey, digest_size=16)
+    return f'authentication:{digest.hexdigest()}'
+
+
+# a keyed hash of the user's password hash and active flag, or None if there is no such user
+def getUserState(username):
+    state = User.objects.filter(username=username).values_list('password', 'is_active').first()
+
+    if state is None:
+        return None
+
+    password, isActive = state
+    return hashlib.blake2b(f'{password}:{isActive}'.encode(), key=passwordCheckKey, digest_size=16).hexdigest()
+
+
+# how long the representation of an attraction is cached for (see AttractionSerializer)
+attractionCacheTimeout = 60 * 60
+
+
+# the member making the request is looked up at most once per request, since
+# several serializers (and their create/update methods) need to access it;
+# it is only ever assigned to relations, so only its primary key is loaded
+def getMemberMakingTheRequest(request):
+    member = getattr(request, '_cachedMember', None)
+
+    if member is None:
+        member = Member.objects.only('baseUser').get(baseUser_id=request.user.id)
+        request._cachedMember = member
+
+    return member
+
+
+# the fields of a ModelSerializer are built by introspecting the model on every
+# instantiation; the resulting fields are cached on the serializer class instead,
+# and each instance receives shallow copies of them, which are then bound to it
+class CachedFieldsMixin:
+    def get_fields(self):
+        serializerClass = type(self)
+        # looking up the class' own dictionary, so that subclasses don't reuse the parent's fields
+        cachedFields = serializerClass.__dict__.get('_cachedFields')
+
+        if cachedFields is None:
+            cachedFields = super().get_fields()
+            serializerClass._cachedFields = cachedFields
+
+        return {name: copy(field) for name, field in cachedFields.items()}
+
+
+# the current date, in the configured time zone, computed once per request
+def getRequestDate(request):
+    currentDate = getattr(request, '_cachedDate', None)
+
+    if currentDate is None:
+        currentDate = timezone.localdate()
+        request._cachedDate = currentDate
+
+    return currentDate
+
+
+# lets the views fetch the related objects rendered by a serializer in bulk,
+# instead of issuing additional queries for every serialized instance
+# (only_fields optionally narrows the selected columns to the ones actually rendered)
+class EagerLoadingMixin:
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    only_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        # calling select_related without arguments would follow every foreign key
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        if cls.only_fields:
+            queryset = queryset.only(*cls.only_fields)
+        return queryset
+
+
 # includes the email field and is, therefore, accessible
 # only to users making requests on their own instance
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username', 'first_name', 'last_name', 'email']
+        fields = ('id', 'username', 'first_name', 'last_name', 'email')
 
 
 # accessible to all authenticated users
 class PrivateUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username', 'first_name', 'last_name']
+        fields = ('id', 'username', 'first_name', 'last_name')
 
 
 # nested in the corresponding member serializer and used within related list serializers
-class SmallUserSerializer(serializers.ModelSerializer):
+class SmallUserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username']
+        fields = ('id', 'username')
 
 
 class RegisterUserSerializer(serializers.ModelSerializer):
@@ -38,34 +174,26 @@ class RegisterUserSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['username', 'password', 'passwordCheck', 'first_name', 'last_name', 'email']
+        fields = ('username', 'password', 'passwordCheck', 'first_name', 'last_name', 'email')
         # the password hashes should not be viewed, nor returned after creation
         extra_kwargs = {'passwordCheck': {'write_only': True}, 'password': {'write_only': True}}
 
-    # custom save method logic, to accommodate password 
-    # matching and properly setting the validated password
-    def save(self, **kwargs):
-        password = self.validated_data['password']
-        passwordCheck = self.validated_data['passwordCheck']
-
-        # the two password fields must match
-        if password != passwordCheck:
-            raise serializers.ValidationError({'password': 'Passwords must match!'})
-        
-        # email can be neither null, nor blank
-        if self.validated_data.get('email') is None or self.validated_data['email'] == '':
-            raise serializers.ValidationError({'email': 'Email field is required.'})
-
+    # custom create method logic, to properly set the validated password
+    def create(self, validated_data):
         # creating instance of User Model
-        user = User(username=self.validated_data['username'], 
+        user = User(username=validated_data['username'], 
                     # first and last names can be blank
-                    first_name=self.validated_data.pop('first_name', ''), 
-                    last_name=self.validated_data.pop('last_name', ''),
-                    email=self.validated_data.pop('email'))
+                    first_name=validated_data.get('first_name', ''), 
+                    last_name=validated_data.get('last_name', ''),
+                    email=validated_data['email'])
         
-        # properly setting the password
-        user.set_password(password)
-        user.save()
+        # properly setting the password, only once all the checks have passed
+        user.set_password(validated_data['password'])
+
+        # the associated member is created along with the user (see signals.py)
+        with transaction.atomic():
+            user.save()
+
         return user
 
 
@@ -82,8 +210,31 @@ class LoginSerializer(serializers.Serializer):
         if not username or not password:
             raise serializers.ValidationError({'authorization': 'Both "username" and "password" are required!'})
         
-        # using the built-in django method for authentication
-        user = authenticate(request=self.context['request'], username=username, password=password)
+        cacheKey = getAuthenticationCacheKey(username, password)
+        cachedOutcome = cache.get(cacheKey)
+
+        user = None
+
+        # the same credentials were recently rejected; they are rejected again only
+        # if the user hasn't been registered, changed or reactivated in the meantime
+        if cachedOutcome is not None and cachedOutcome[0] is False:
+            if getUserState(username) == cachedOutcome[1]:
+                raise serializers.ValidationError({'authorization': 'Invalid username or password!'})
+
+        # the same credentials were recently accepted; the user is reused only if
+        # they are still active and their password hasn't changed in the meantime
+        elif cachedOutcome is not None:
+            userId, sessionAuthHash = cachedOutcome
+            user = User.objects.filter(pk=userId, is_active=True).first()
+
+            if user is not None and not constant_time_compare(user.get_session_auth_hash(), sessionAuthHash):
+                user = None
+
+        if user is None:
+            # using the built-in django method for authentication
+            user = authenticate(request=self.context['request'], username=username, password=password)
+            cachedOutcome = (user.pk, user.get_session_auth_hash()) if user else (False, getUserState(username))
+            cache.set(cacheKey, cachedOutcome, authenticationCacheTimeout)
 
         if not user:
             raise serializers.ValidationError({'authorization': 'Invalid username or password!'})
@@ -99,7 +250,7 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ['password', 'newPassword']
+        fields = ('password', 'newPassword')
         extra_kwargs = {'password': {'write_only': True}}
 
     # custom update method for password checking and newPassword validation
@@ -107,13 +258,18 @@ class ChangePasswordSerializer(serializers.ModelSerializer):
         password = validated_data['password']
         updatedPassword = validated_data['newPassword']
 
+        # rejected before any password hashing takes place
+        if password == updatedPassword:
+            raise serializers.ValidationError({'newPassword': 'The new password must differ from the current one.'})
+
         # make sure provided current password is valid
-        if not check_password(password, instance.password):
+        if not cachedCheckPassword(password, instance.password):
             raise serializers.ValidationError({'password': 'Incorrect password.'})
 
         # validate provided new password
+        from django.contrib.auth.password_validation import validate_password
         try:
-            validate_password(updatedPassword)
+            validate_password(updatedPassword, password_validators=getPasswordValidators())
         except Exception as invalidPassword:
             raise serializers.ValidationError({'newPassword': invalidPassword})
 
@@ -127,43 +283,56 @@ class RegisterMemberSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Member
-        fields = ['baseUser', 'profilePhoto', 'birthDate']
+        fields = ('baseUser', 'profilePhoto', 'birthDate')
+
+    # the password match and the email presence are checked during validation, so that
+    # invalid requests get rejected before any (intentionally slow) password hashing;
+    # the errors are reported at the top level, rather than nested under 'baseUser'
+    def validate(self, data):
+        userData = data['baseUser']
+
+        # the two password fields must match
+        if userData['password'] != userData['passwordCheck']:
+            raise serializers.ValidationError({'password': 'Passwords must match!'})
+
+        # email can be neither null, nor blank
+        if not userData.get('email'):
+            raise serializers.ValidationError({'email': 'Email field is required.'})
+
+        return data
 
     # custom save method, so that a baseUser can be instantiated
     # before the Member instance itself;
     def save(self, **kwargs):
-        baseUserData = self.validated_data['baseUser']
-        # creating serializer based on validated data
-        baseUserSerializer = RegisterUserSerializer(data=baseUserData)
-        # validating said data
-        baseUserSerializer.is_valid(raise_exception=True)
-        # creating the instance
-        baseUser = baseUserSerializer.save()
-
-        member = None
-
-        if 'profilePhoto' in self.validated_data:
-            member = Member(
-                baseUser=baseUser,
-                profilePhoto=self.validated_data.pop('profilePhoto'),
-                birthDate=self.validated_data['birthDate']
-            )
-        else:
-            member = Member(
-                baseUser=baseUser,
-                birthDate=self.validated_data['birthDate']
-            )
-
-        member.save()
+        with transaction.atomic():
+            # the user data has already been validated as part of this
+            # serializer's validation, so the instance is created directly
+            baseUser = RegisterUserSerializer().create(self.validated_data['baseUser'])
+
+            memberFields = {'baseUser': baseUser, 'birthDate': self.validated_data['birthDate']}
+
+            # when no profile photo is provided, the model's default is used
+            if 'profilePhoto' in self.validated_data:
+                memberFields['profilePhoto'] = self.validated_data['profilePhoto']
+
+            # the member row already exists at this point, having been created
+            # along with the user (see signals.py), so it is saved, not inserted
+            member = Member(**memberFields)
+            member.save()
+
         return member
 
 
-class MemberSerializer(serializers.ModelSerializer):
+class MemberSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     baseUser = UserSerializer()
+    select_related_fields = ('baseUser',)
+    # the columns used by every member serializer (the password hash, for instance, is not)
+    only_fields = ('profilePhoto', 'birthDate', 'baseUser__username', 'baseUser__first_name',
+                   'baseUser__last_name', 'baseUser__email')
 
     class Meta:
         model = Member
-        fields = ['baseUser', 'profilePhoto', 'birthDate']
+        fields = ('baseUser', 'profilePhoto', 'birthDate')
 
     # custom update method, for updating the related user
     # with the corresponding validated data, before updating
@@ -173,13 +342,13 @@ class MemberSerializer(serializers.ModelSerializer):
         extractedUserData = validated_data.pop('baseUser', None)
 
         if extractedUserData:
-            # aquire instance
+            # aquire instance (fetched along with the member by the view)
             currentBaseUser = instance.baseUser
-            # serialize and verify the validated user data
-            currentBaseUserSerializer = UserSerializer(currentBaseUser, data=extractedUserData, partial=True)
-            currentBaseUserSerializer.is_valid(raise_exception=True)
-            # save the changes
-            currentBaseUserSerializer.save()
+            # the user data was already validated by the nested serializer,
+            # so the changes are applied directly, updating only the provided columns
+            for field, value in extractedUserData.items():
+                setattr(currentBaseUser, field, value)
+            currentBaseUser.save(update_fields=list(extractedUserData.keys()))
         
         # update the member itself
         return super().update(instance, validated_data)
@@ -190,40 +359,51 @@ class PrivateMemberSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Member
-        fields = ['baseUser', 'profilePhoto', 'birthDate']
+        fields = ('baseUser', 'profilePhoto', 'birthDate')
+
+
+# fetches the users of all the listed members in a single query, regardless
+# of whether the provided queryset used select_related or not (in which case
+# prefetching is a no-op)
+class MemberListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        members = list(data.all() if isinstance(data, models.Manager) else data)
+        prefetch_related_objects(members, 'baseUser')
+        return super().to_representation(members)
 
 
 # nested in related models and used for the list action
-class SmallAndListMemberSerializer(serializers.ModelSerializer):
+class SmallAndListMemberSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     baseUser = SmallUserSerializer(read_only=True)
 
     class Meta:
         model = Member
-        fields = ['baseUser', 'profilePhoto']
+        fields = ('baseUser', 'profilePhoto')
+        list_serializer_class = MemberListSerializer
 
 
-class SmallGroupSerializer(serializers.ModelSerializer):
+class SmallGroupSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Group
-        fields = ['id', 'name']
+        fields = ('id', 'name')
 
 
 class GroupSerializer(serializers.ModelSerializer):
     class Meta:
         model = Group
-        fields = ['id', 'name', 'description']
+        fields = ('id', 'name', 'description')
 
 
-class BelongsToSerializer(serializers.ModelSerializer):
+class BelongsToSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = BelongsTo
-        fields = ['id', 'user', 'group', 'isAdmin', 'nickname']
+        fields = ('id', 'user', 'group', 'isAdmin', 'nickname')
 
 
 class RouteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Route
-        fields = ['id', 'title', 'description', 'verified', 'public', 'startingPointLat', 'startingPointLon', 'publicationDate', 'user', 'group']
+        fields = ('id', 'title', 'description', 'verified', 'public', 'startingPointLat', 'startingPointLon', 'publicationDate', 'user', 'group')
         extra_kwargs = {'verified': {'read_only': True}, 'publicationDate': {'read_only': True}}
 
     # only one and exactly one of the two nullable fields (group, user) can be null at a time.
@@ -231,7 +411,7 @@ class RouteSerializer(serializers.ModelSerializer):
         group = data.get('group')
         user = data.get('user')
 
-        if (user is not None and group is not None) or (user is None and group is None):
+        if (user is None) == (group is None):
             raise serializers.ValidationError("Only one of user and group can be specified")
         
         # making sure that unspecified fields are set to None, instead of outright not existing
@@ -242,65 +422,83 @@ class RouteSerializer(serializers.ModelSerializer):
 
 
 # retrieves partial information about a route
-class ListRouteSerializer(serializers.ModelSerializer):
+class ListRouteSerializer(CachedFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     user = SmallAndListMemberSerializer()
     group = SmallGroupSerializer()
+    select_related_fields = ('user__baseUser', 'group')
+    only_fields = ('title', 'description', 'verified', 'startingPointLat', 'startingPointLon', 'publicationDate',
+                   'user__profilePhoto', 'user__baseUser__username', 'group__name')
 
     class Meta:
         model = Route
-        fields = ['id', 'title', 'description', 'verified', 'startingPointLat', 'startingPointLon', 'publicationDate', 'user', 'group']
+        fields = ('id', 'title', 'description', 'verified', 'startingPointLat', 'startingPointLon', 'publicationDate', 'user', 'group')
         extra_kwargs = {'publicationDate': {'read_only': True}}
 
 
-class SmallRouteSerializer(serializers.ModelSerializer):
+class SmallRouteSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Route
-        fields = ['id', 'title']
+        fields = ('id', 'title')
 
 
-class IsWithinSerializer(serializers.ModelSerializer):
+class IsWithinSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
-        model = isWithin
-        fields = ['id', 'route', 'attraction', 'orderNumber']
+        model = IsWithin
+        fields = ('id', 'route', 'attraction', 'orderNumber')
 
 
-class SmallAttractionSerializer(serializers.ModelSerializer):
+class SmallAttractionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Attraction
-        fields = ['id', 'name']
+        fields = ('id', 'name')
 
 
-class AttractionSerializer(serializers.ModelSerializer):
+class AttractionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Attraction
-        fields = ['id', 'name', 'generalDescription', 'latitude', 'longitude']
+        fields = ('id', 'name', 'generalDescription', 'latitude', 'longitude')
+
+    # attractions rarely change, so their representations are cached; since the key contains
+    # the time of the last modification, any change results in a new (uncached) key
+    def to_representation(self, instance):
+        cacheKey = f'attraction:{instance.pk}:{instance.updatedAt.timestamp()}'
+        representation = cache.get(cacheKey)
+
+        if representation is None:
+            representation = super().to_representation(instance)
+            cache.set(cacheKey, representation, attractionCacheTimeout)
 
+        return representation
 
-class StatusSerializer(serializers.ModelSerializer):
+
+class StatusSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Status
-        fields = ['id', 'status']
+        fields = ('id', 'status')
 
         
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Tag
-        fields = ['id', 'tagName']
+        fields = ('id', 'tagName')
 
 
 class IsTaggedSerializer(serializers.ModelSerializer):
     class Meta:
         model = IsTagged
-        fields = ['id', 'tag', 'attraction']
+        fields = ('id', 'tag', 'attraction')
 
 
-class ListNotebookSerializer(serializers.ModelSerializer):
+class ListNotebookSerializer(CachedFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     status = StatusSerializer(read_only=True)
     route = SmallRouteSerializer(read_only=True)
+    select_related_fields = ('status', 'route')
+    # leaves out the notes, which can be rather long
+    only_fields = ('title', 'status__status', 'route__title')
 
     class Meta:
         model = Notebook
-        fields = ['id', 'title', 'status', 'route']
+        fields = ('id', 'title', 'status', 'route')
 
 
 # this serializer is designed to handle image objects, 
@@ -321,8 +519,8 @@ class ImageUploadSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Image
-        fields = ['id', 'image', 'imagePath']
-        read_only_fields=['imagePath']
+        fields = ('id', 'image', 'imagePath')
+        read_only_fields = ('imagePath',)
 
     def create(self, validated_data):
         image = validated_data.pop('image')
@@ -351,25 +549,15 @@ class ImageUploadSerializer(serializers.ModelSerializer):
         instance = super().create(validated_data)
         instance.save()
         return instance
-    
-    # the delete method of the serializer is responsible for removing instances 
-    # from both the database and the corresponding folder where the image file is stored
-    def delete(self, instance):
-        try:
-            default_storage.delete(instance.imagePath)
-        except Exception as e:
-            raise ValidationError('Failed to delete image {}'.format(instance.imagePath))
-
-        instance.delete()
 
 
-class NotebookSerializer(serializers.ModelSerializer):
+class NotebookSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     images = serializers.ListField(required=False)
     images_list = serializers.SerializerMethodField()
 
     class Meta:
         model = Notebook
-        fields = ['id', 'route', 'title', 'note', 'status', 'dateStarted', 'dateCompleted', 'images', 'images_list']
+        fields = ('id', 'route', 'title', 'note', 'status', 'dateStarted', 'dateCompleted', 'images', 'images_list')
         extra_kwargs = {'dateStarted': {'read_only': True}, 'dateCompleted': {'read_only': True}}
 
     # this method retrieves and returns a list of all the images 
@@ -384,14 +572,14 @@ class NotebookSerializer(serializers.ModelSerializer):
         if not request:
             raise serializers.ValidationError({'request': 'Request related error'})
 
-        member = Member.objects.get(baseUser=request.user)
+        member = getMemberMakingTheRequest(request)
         # the user making the request gets associated with the current notebook-entry
         validated_data['user'] = member
 
         # if the user sets the status as 'Completed' upon creation
         if validated_data['status'].status == "Completed":
             # then the Completed date also becomes today's date
-            validated_data['dateCompleted'] = date.today()
+            validated_data['dateCompleted'] = getRequestDate(request)
 
         # the serializer is iterating through the images and assigning 
         # them to the current notebook and owner before saving them to the database
@@ -415,7 +603,7 @@ class NotebookSerializer(serializers.ModelSerializer):
         if not request: 
             raise serializers.ValidationError({'request': 'Request related error'})
 
-        member = Member.objects.get(baseUser=request.user)
+        member = getMemberMakingTheRequest(request)
         validated_data['user'] = member
         
         # the previous status
@@ -423,11 +611,11 @@ class NotebookSerializer(serializers.ModelSerializer):
 
         # the completion date is updated only when the status is set to 'completed' from a previous state
         if validated_data['status'].status == 'Completed' and old_status != 'Completed':
-            validated_data['dateCompleted'] = date.today()
+            validated_data['dateCompleted'] = getRequestDate(request)
         
         # if upon completing the route, the user decides to move it to a previous state, both dates get reset
         elif validated_data['status'].status != 'Completed' and old_status == 'Completed':
-            validated_data['dateStarted'] = date.today()
+            validated_data['dateStarted'] = getRequestDate(request)
             validated_data['dateCompleted'] = None
 
         # appending new images to the existing list
@@ -444,18 +632,18 @@ class NotebookSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class RatingFlagSerializer(serializers.ModelSerializer):
+class RatingFlagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = RatingFlag
-        fields = ['id', 'user', 'rating', 'comment', 'route', 'attraction']
-        read_only_fields = ['user']
+        fields = ('id', 'user', 'rating', 'comment', 'route', 'attraction')
+        read_only_fields = ('user',)
         
     def validate(self, data):
         route = data.get('route')
         attraction = data.get('attraction')
         
         # only one and exactly one of the two nullable fields (route, attraction) can be null at a time
-        if (route is not None and attraction is not None) or (route is None and attraction is None):
+        if (route is None) == (attraction is None):
             raise serializers.ValidationError("Either 'route' or 'attraction' must be specified.")
 
         # making sure that unspecified fields are set to None, instead of outright not existing
@@ -463,53 +651,10 @@ class RatingFlagSerializer(serializers.ModelSerializer):
         data['attraction'] = attraction
 
         return data
-    
-    def save(self, **kwargs):
-        assert hasattr(self, '_errors'), (
-            'You must call `.is_valid()` before calling `.save()`.'
-        )
-
-        assert not self.errors, (
-            'You cannot call `.save()` on a serializer with invalid data.'
-        )
-
-        # Guard against incorrect use of `serializer.save(commit=False)`
-        assert 'commit' not in kwargs, (
-            "'commit' is not a valid keyword argument to the 'save()' method. "
-            "If you need to access data before committing to the database then "
-            "inspect 'serializer.validated_data' instead. "
-            "You can also pass additional keyword arguments to 'save()' if you "
-            "need to set extra attributes on the saved model instance. "
-            "For example: 'serializer.save(owner=request.user)'.'"
-        )
-
-        assert not hasattr(self, '_data'), (
-            "You cannot call `.save()` after accessing `serializer.data`."
-            "If you need to access data before committing to the database then "
-            "inspect 'serializer.validated_data' instead. "
-        )
-
-        validated_data = {**self.validated_data, **kwargs}
-
-        currentUser = self.context['request'].user
-        validated_data['user'] = Member.objects.get(baseUser=currentUser)
-
-        if self.instance is not None:
-            self.instance = self.update(self.instance, validated_data)
-            assert self.instance is not None, (
-                '`update()` did not return an object instance.'
-            )
-        else:
-            self.instance = self.create(validated_data)
-            assert self.instance is not None, (
-                '`create()` did not return an object instance.'
-            )
-
-        return self.instance
 
 
 class RatingFlagTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = RatingFlagType
-        fields = ['id', 'type']
+        fields = ('id', 'type')
         extra_kwargs = {'type': {'read_only': True}}
@@ -63,11 +63,12 @@ def create_media_subdirectories(sender, **kwargs):
 # and removing their corresponding files from the media directory
 # if an error occurs while attempting to delete an image file, it raises a validation error with a message 
 # indicating the file that failed to delete
+# (only the paths are needed, and they are iterated in chunks, instead of keeping every image in memory)
 @receiver(pre_delete, sender=Notebook)
 def sweep_notebook_associated_images(sender, instance, **kwargs):
-    images = Image.objects.filter(notebook=instance)
-    for image in images:
+    imagePaths = Image.objects.filter(notebook=instance).values_list('imagePath', flat=True)
+    for imagePath in imagePaths.iterator(chunk_size=500):
         try:
-            os.remove(settings.MEDIA_ROOT + '/' + image.imagePath)
+            os.remove(settings.MEDIA_ROOT + '/' + imagePath)
         except OSError:
-            raise ValidationError('Failed to delete image {}'.format(image.imagePath))
+            raise ValidationError('Failed to delete image {}'.format(imagePath))
@@ -1,4 +1,7 @@
 from django.urls import reverse
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from .models import *
@@ -52,6 +55,51 @@ class RouteTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+    def testListQueryCount(self):
+        """
+        Verify that the number of queries issued by a list request doesn't depend on the number of listed routes
+        """
+
+        user = User.objects.get(pk=3)
+        self.client.force_login(user)
+        listRouteURL = reverse('core:route-list')
+
+        with CaptureQueriesContext(connection) as initialQueries:
+            response = self.client.get(listRouteURL)
+        self.assertEqual(len(response.data['results']), 2)
+
+        # public routes owned by other users and groups
+        for ownership in [{'user_id': 1}, {'user_id': 2}, {'group_id': 2}]:
+            Route.objects.create(title='extra', description='extra', public=True, startingPointLat=0,
+                                 startingPointLon=0, **ownership)
+
+        with self.assertNumQueries(len(initialQueries)):
+            response = self.client.get(listRouteURL)
+        self.assertEqual(len(response.data['results']), 5)
+
+
+    def testFilteringByTag(self):
+        """
+        Verify that filtering routes by the tag of their attractions returns each matching route once,
+        even when several of its attractions have said tag
+        """
+
+        user = User.objects.get(pk=3)
+        self.client.force_login(user)
+
+        for attractionId in [1, 2]:
+            IsWithin.objects.create(route_id=1, attraction_id=attractionId, orderNumber=attractionId)
+            IsTagged.objects.create(attraction_id=attractionId, tag=Tag.objects.get(tagName='Nature'))
+
+        listRouteURL = reverse('core:route-list')
+        response = self.client.get(listRouteURL, {'isWithin__attraction__isTagged__tag__tagName': 'Nature'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([route['id'] for route in response.data['results']], [1])
+
+        response = self.client.get(listRouteURL, {'isWithin__attraction__name': 'an-awesome-attraction-2'})
+        self.assertEqual([route['id'] for route in response.data['results']], [1])
+
+
 class GroupTests(APITestCase):
     fixtures = ['testing-members.json']
 
@@ -111,6 +159,93 @@ class MemberTests(APITestCase):
 
         self.assertEqual(deletedUser, None)
 
+    def testRegistrationErrors(self):
+        """
+        Verify that invalid registrations are rejected with top-level errors and no user is created, as follows:
+            - the two password fields don't match => error on 'password'
+            - the email is blank => error on 'email'
+        """
+
+        registerURL = reverse('core:member-list')
+        userData = {'username': 'test-new', 'password': 'extremely-secure-123',
+                    'passwordCheck': 'extremely-secure-123', 'email': 'test-new@example.com'}
+
+        data = {'baseUser': {**userData, 'passwordCheck': 'extremely-secure-456'}, 'birthDate': '01.01.2000'}
+        response = self.client.post(registerURL, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data), ['password'])
+
+        data = {'baseUser': {**userData, 'email': ''}, 'birthDate': '01.01.2000'}
+        response = self.client.post(registerURL, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(response.data), ['email'])
+
+        self.assertFalse(User.objects.filter(username='test-new').exists())
+
+
+class LoginTests(APITestCase):
+    fixtures = ['testing-members.json']
+
+    def setUp(self):
+        # the outcomes of authentication attempts are cached between requests
+        cache.clear()
+
+        user = User.objects.get(pk=2)
+        user.set_password('extremely-secure-123')
+        user.save()
+
+    def testCachedAuthenticationOutcomes(self):
+        """
+        Verify that caching the outcome of authentication attempts doesn't alter the login behaviour, as follows:
+            - user test-2 logs in with a wrong password twice => rejected both times
+            - user test-2 logs in with the correct password twice => accepted both times
+            - user test-2 changes their password and logs in with the old one => rejected
+            - user test-2 logs in with the new password => accepted
+        """
+
+        loginURL = reverse('core:login')
+
+        for _ in range(2):
+            response = self.client.post(loginURL, {'username': 'test-2', 'password': 'wrong-password'})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        for _ in range(2):
+            response = self.client.post(loginURL, {'username': 'test-2', 'password': 'extremely-secure-123'})
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        user = User.objects.get(pk=2)
+        user.set_password('even-more-secure-456')
+        user.save()
+
+        response = self.client.post(loginURL, {'username': 'test-2', 'password': 'extremely-secure-123'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(loginURL, {'username': 'test-2', 'password': 'even-more-secure-456'})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+    def testLoginAfterRegistration(self):
+        """
+        Verify that a rejected authentication attempt doesn't prevent logging in after registering, as follows:
+            - user test-new, who isn't registered yet, logs in => rejected
+            - user test-new registers with the same credentials
+            - user test-new logs in with the same credentials => accepted
+        """
+
+        loginURL = reverse('core:login')
+        credentials = {'username': 'test-new', 'password': 'extremely-secure-123'}
+
+        response = self.client.post(loginURL, credentials)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        data = {
+            'baseUser': {**credentials, 'passwordCheck': credentials['password'], 'email': 'test-new@example.com'},
+            'birthDate': '01.01.2000',
+        }
+        response = self.client.post(reverse('core:member-list'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(loginURL, credentials)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
 
 class BelongsToTests(APITestCase):
     fixtures = ['testing-members.json', 'testing-groups.json', 'testing-belongsTo.json']
@@ -131,6 +266,19 @@ class BelongsToTests(APITestCase):
         self.assertEqual(len(response.data['results']), 3)
         self.assertNotIn({'user': 2, 'group': 2, 'isAdmin': True}, response.data['results'])
 
+    def testListWithoutGroups(self):
+        """
+        Verify that a user who doesn't belong to any group receives an empty list
+        """
+
+        url = reverse('core:belongsTo-list')
+        user = User.objects.create(username='test-without-groups')
+        self.client.force_login(user)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
 
 class IsTaggedTests(APITestCase):
     fixtures = ['testing-members.json', 'testing-attractions.json']
@@ -207,3 +355,32 @@ class IsTaggedTests(APITestCase):
         response = self.client.get(listTagURL)
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0], {'id': 3, 'tag': 3, 'attraction': 1})
+
+    def testFilteredTagListAfterTagging(self):
+        """
+        Verify that the tags of an attraction are listed right after the attraction is tagged, as follows:
+            - user lists all the tags and the tags of the attraction => no tags for the attraction
+            - user tags the attraction
+            - user lists the tags of the attraction => the new tag is included
+        """
+
+        # the unfiltered lookup table lists are cached between requests
+        cache.clear()
+
+        listTagURL = reverse('core:tag-list')
+        attractionTagsURL = listTagURL + '?isTagged__attraction_id=1'
+        self.client.force_login(User.objects.get(pk=1))
+
+        response = self.client.get(listTagURL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(attractionTagsURL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+        response = self.client.post(reverse('core:isTagged-list'), {'tag': 1, 'attraction': 1})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(attractionTagsURL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['id'], 1)
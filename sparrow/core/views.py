@@ -5,25 +5,51 @@ from rest_framework.decorators import action
 from rest_framework import status, mixins
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.contrib.auth import login, logout
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from .serializers import *
 from .permissions import *
+from .filters import RouteFilterSet
+
+
+# the lookup tables (statuses, tags, rating/flag types) rarely change, so their list responses are cached;
+# only the 'list' handler is decorated, which runs after the authentication and permission checks,
+# so the cached responses (identical for every user) are still only served to authorized users
+lookupTableCacheTimeout = 60 * 15
+
+
+@method_decorator(cache_page(lookupTableCacheTimeout), name='cachedList')
+class CachedUnfilteredListMixin:
+    # the lists filtered by a relation (e.g. the tags of an attraction) change with every write to that relation,
+    # so only the unfiltered lists are served from the cache
+    def list(self, request, *args, **kwargs):
+        if any(field in request.query_params for field in self.filterset_fields):
+            return super().list(request, *args, **kwargs)
+        return self.cachedList(request, *args, **kwargs)
+
+    def cachedList(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
 
 class RouteViewSet(ModelViewSet):
     # search & options for filtering and ordering
-    filterset_fields = ['verified', 'user__baseUser__username', 'user__baseUser__first_name', 'user__baseUser__last_name',
-                        'group__name', 'isWithin__attraction__name', 'isWithin__attraction__isTagged__tag__tagName',
-                        'notebook__id', 'user', 'group', 'ratingFlag__id']
+    filterset_class = RouteFilterSet
     search_fields = ['title', 'description', 'startingPointLat', 'startingPointLon']
 
     def get_queryset(self):
         if self.action == 'list':
-            filteredIds = [route.id for route in Route.objects.all() if RouteIsPublic().has_object_permission(self.request, self, route)]
-            queryset = Route.objects.filter(id__in=filteredIds)
+            queryset = Route.objects.filter(RouteIsPublic().getQueryFilter(self.request))
+        else:
+            # the owner and the group are accessed by the permission checks
+            queryset = Route.objects.select_related('user__baseUser', 'group')
 
-            return queryset
+        # fetching the related objects rendered by the serializer in the same query
+        serializerClass = self.get_serializer_class()
+        if hasattr(serializerClass, 'setup_eager_loading'):
+            queryset = serializerClass.setup_eager_loading(queryset)
 
-        return Route.objects.all()
+        return queryset
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -49,13 +75,9 @@ class IsWithinViewSet(GenericViewSet, mixins.ListModelMixin, mixins.CreateModelM
 
     def get_queryset(self):
         if self.action == 'list':
-            initialQuerySet = isWithin.objects.all()
-            filteredIds = [IsWithin.id for IsWithin in initialQuerySet if RouteIsPublic().has_object_permission(self.request, self, IsWithin.route)]
-            querySet = initialQuerySet.filter(id__in=filteredIds)
+            return IsWithin.objects.filter(RouteIsPublic().getQueryFilter(self.request, prefix='route__'))
 
-            return querySet
-
-        return isWithin.objects.all()
+        return IsWithin.objects.all()
 
 
 class GroupViewSet(ModelViewSet):
@@ -72,12 +94,10 @@ class GroupViewSet(ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
     # creates a belongsTo entity, adding the user creating the group as an admin
+    # (the member's primary key is the id of their user, so the member itself needn't be fetched)
     def perform_create(self, serializer, request):
         group = serializer.save()
-        member = Member.objects.get(pk=request.user.id)
-
-        instance = BelongsTo(user=member, group=group, isAdmin=True)
-        instance.save()
+        BelongsTo.objects.create(user_id=request.user.id, group=group, isAdmin=True)
 
     def get_permissions(self):
         # if the use tries to see a group/ list of groups, check if
@@ -93,10 +113,20 @@ class GroupViewSet(ModelViewSet):
 
 
 class MemberViewSet(ModelViewSet):
-    queryset = Member.objects.all()
+    # every member serializer renders the associated baseUser; the serializer class
+    # can't be used to decide upon the queryset here, since 'retrieve' requires
+    # fetching the object in order to choose the serializer
+    queryset = MemberSerializer.setup_eager_loading(Member.objects.all())
     search_fields = ['baseUser__username', 'baseUser__first_name', 'baseUser__last_name']
     filterset_fields = ['belongsTo__group_id', 'route__id', 'ratingFlag__id']
 
+    # the object is fetched once per request, since the 'retrieve' action
+    # also needs it in order to choose the serializer class
+    def get_object(self):
+        if not hasattr(self, '_cachedObject'):
+            self._cachedObject = super().get_object()
+        return self._cachedObject
+
     def get_serializer_class(self):
         if self.action == 'list':
             return SmallAndListMemberSerializer
@@ -134,8 +164,9 @@ class MemberViewSet(ModelViewSet):
     
     def removeProfilePhoto(self, request, **kwargs):
         member = self.get_object()
+        # the default photo is a constant path, so only the affected column is written
         member.profilePhoto = defaultProfilePhoto
-        member.save()
+        member.save(update_fields=['profilePhoto'])
         return Response(status=status.HTTP_200_OK)
     
 
@@ -155,7 +186,8 @@ class LoginViewSet(GenericViewSet):
         # the validated user gets logged in, which means that
         # the response header will contain a session_id cookie
         login(self.request, user)
-        return Response(None, status=status.HTTP_202_ACCEPTED)
+        # no content is returned, so no content negotiation or rendering is needed
+        return HttpResponse(status=status.HTTP_202_ACCEPTED)
 
 
 # since it is not necessary for a serializer or a model to be
@@ -163,7 +195,7 @@ class LoginViewSet(GenericViewSet):
 class LogoutView(APIView):
     def post(self, request):
         logout(request)     # django handles the logout procedure
-        return Response(None, status=status.HTTP_204_NO_CONTENT)
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
 
 
 # since only the update action will be performed, a mixin is used
@@ -188,23 +220,25 @@ class BelongsToViewSet(GenericViewSet, mixins.ListModelMixin, mixins.CreateModel
 
     def get_queryset(self):
         if self.action == 'list':
-            memberMakingTheRequest = Member.objects.get(pk=self.request.user.id)
-            groupsOfMemberMakingTheRequest = Group.objects.filter(belongsTo__user=memberMakingTheRequest)
-            queryset = BelongsTo.objects.filter(group=groupsOfMemberMakingTheRequest[0])
-
-            for group in groupsOfMemberMakingTheRequest:
-                queryset |= BelongsTo.objects.filter(group=group)
-
-            return queryset
+            # the entries of all the groups the member making the request belongs to
+            groupsOfMemberMakingTheRequest = Group.objects.filter(belongsTo__user_id=self.request.user.id)
+            return BelongsTo.objects.filter(group__in=groupsOfMemberMakingTheRequest)
 
         return BelongsTo.objects.all()
 
 
 class NotebookViewSet(ModelViewSet):
-    queryset = Notebook.objects.all()
+    # the permission checks and the list serializer access these relations
+    queryset = Notebook.objects.select_related('user__baseUser', 'status', 'route')
     filterset_fields = ["user_id"]
     permission_classes = [IsOwnedByTheUserMakingTheRequest]
 
+    def get_queryset(self):
+        if self.action == 'list':
+            return ListNotebookSerializer.setup_eager_loading(Notebook.objects.all())
+
+        return super().get_queryset()
+
     def get_serializer_class(self):
         if self.action == 'list':
             return ListNotebookSerializer
@@ -219,7 +253,7 @@ class NotebookViewSet(ModelViewSet):
         return [IsOwnedByTheUserMakingTheRequest()]
 
 
-class StatusViewSet(GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin):
+class StatusViewSet(CachedUnfilteredListMixin, GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin):
     queryset = Status.objects.all()
     serializer_class = StatusSerializer
     permission_classes = [IsAuthenticated]
@@ -238,18 +272,26 @@ class RatingFlagViewSet(GenericViewSet, mixins.ListModelMixin, mixins.CreateMode
             return RatingFlag.objects.all()
         
         # once created, the flags can't be altered, which means
-        # that the query set can be limitted to ratings
-        return RatingFlag.objects.filter(rating_id__lte=5)
+        # that the query set can be limitted to ratings;
+        # the related objects are accessed by the permission checks
+        return RatingFlag.objects.filter(rating_id__lte=5).select_related('user__baseUser', 'route', 'attraction')
+
+    # the ratings/flags are always associated with the member making the request
+    def perform_create(self, serializer):
+        serializer.save(user=getMemberMakingTheRequest(self.request))
 
+    def perform_update(self, serializer):
+        serializer.save(user=getMemberMakingTheRequest(self.request))
 
-class RatingFlagTypeViewSet(GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin):
+
+class RatingFlagTypeViewSet(CachedUnfilteredListMixin, GenericViewSet, mixins.ListModelMixin, mixins.RetrieveModelMixin):
     queryset = RatingFlagType.objects.all()
     serializer_class = RatingFlagTypeSerializer
     permission_classes = [IsAuthenticated]
     filterset_fields = ['ratingFlag__id']
 
 
-class TagViewSet(GenericViewSet, mixins.ListModelMixin):
+class TagViewSet(CachedUnfilteredListMixin, GenericViewSet, mixins.ListModelMixin):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [IsAuthenticated]
@@ -263,11 +305,8 @@ class IsTaggedViewSet(GenericViewSet, mixins.ListModelMixin, mixins.CreateModelM
     filterset_fields = ['attraction_id', 'tag_id']
 
 
+# this viewset is designed specifically for deleting instances of images
+# (the image files themselves are removed by the model's delete method)
 class ImageViewSet(ModelViewSet):
     queryset = Image.objects.all()
     serializer_class = ImageUploadSerializer
-
-    # this viewset is designed specifically for deleting instances of images
-    def perform_destroy(self, instance):
-        serializer = self.get_serializer(instance)
-        serializer.delete(instance)
@@ -139,8 +139,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend', 'rest_framework.filters.SearchFilter'],
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.DefaultPagination',
+    'DEFAULT_FILTER_BACKENDS': ['core.filters.CachedFilterBackend', 'rest_framework.filters.SearchFilter'],
     'PAGE_SIZE': 10,
     'DATE_FORMAT': '%d.%m.%Y',
     'DATETIME_FORMAT': '%d.%m.%Y',